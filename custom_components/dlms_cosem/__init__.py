@@ -14,17 +14,23 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers import entity_registry as er
 import structlog
 
-from .const import CONF_HOST, SIGNAL_AVAILABLE
+from .binary_sensor import BINARY_SENSOR_TYPES
+from .const import CONF_HOST
+from .coordinator import DlmsCoordinator
 from .dlms_cosem import DlmsConnection
+from .entity import CosemEntityDescription
+from .sensor import SENSOR_TYPES
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
+PLATFORMS: tuple[Platform, ...] = (Platform.SENSOR, Platform.BINARY_SENSOR)
 
 DEFAULT_LOGGER = structlog.make_filtering_bound_logger(logging.WARNING)
 DEBUG_LOGGER = structlog.make_filtering_bound_logger(logging.DEBUG)
 
+structlog.configure(wrapper_class=DEFAULT_LOGGER)
+
 _LOGGER = logging.getLogger(__name__)
 
 type DlmsCosemConfigEntry = ConfigEntry["DlmsCosemData"]
@@ -34,7 +40,29 @@ type DlmsCosemConfigEntry = ConfigEntry["DlmsCosemData"]
 def _async_logging_changed(event: Event | None = None) -> None:
     """Handle logging change."""
     logger = DEBUG_LOGGER if _LOGGER.isEnabledFor(logging.DEBUG) else DEFAULT_LOGGER
-    structlog.configure(wrapper_class=logger)
+    if structlog.get_config()["wrapper_class"] is not logger:
+        structlog.configure(wrapper_class=logger)
+
+
+@callback
+def _async_enabled_descriptions(
+    hass: HomeAssistant, entry: DlmsCosemConfigEntry
+) -> list[CosemEntityDescription]:
+    """Return descriptions of the entities that will be enabled."""
+    disabled = {
+        entity.unique_id: entity.disabled
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+    }
+    return [
+        description
+        for description in (*SENSOR_TYPES, *BINARY_SENSOR_TYPES)
+        if not disabled.get(
+            f"{entry.unique_id}-{description.key}",
+            not description.entity_registry_enabled_default,
+        )
+    ]
 
 
 @dataclass
@@ -42,12 +70,12 @@ class DlmsCosemData:
     """Represents DLMS/COSEM integration runtime data."""
 
     connection: DlmsConnection
+    coordinator: DlmsCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: DlmsCosemConfigEntry) -> bool:
     """Set up DLMS connection from a config entry."""
     connection = DlmsConnection(hass, entry)
-    structlog.configure(wrapper_class=DEFAULT_LOGGER)
     entry.async_on_unload(
         hass.bus.async_listen(EVENT_LOGGING_CHANGED, _async_logging_changed)
     )
@@ -60,17 +88,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: DlmsCosemConfigEntry) ->
             f"Timed out while connecting to {connection.entry.data[CONF_HOST]}"
         ) from err
 
-    entry.runtime_data = DlmsCosemData(connection)
-
-    async def _async_close_connection(event: Event | None = None) -> None:
-        """Close DLMS connection on HA Stop."""
+    coordinator = DlmsCoordinator(
+        hass, connection, _async_enabled_descriptions(hass, entry)
+    )
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
         await connection.async_close()
+        raise
+
+    entry.runtime_data = DlmsCosemData(connection, coordinator)
+    entry.async_on_unload(
+        connection.async_add_available_listener(coordinator.async_handle_available)
+    )
 
     entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_connection)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, connection.async_close)
     )
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    async_dispatcher_send(hass, SIGNAL_AVAILABLE, True)
     return True
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import timedelta
+from typing import TYPE_CHECKING, Final
 
 from dlms_cosem import cosem, enumerations
 from homeassistant.components.binary_sensor import (
@@ -11,19 +12,21 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import DlmsCosemConfigEntry
-from .const import DEFAULT_SCAN_INTERVAL
+from .const import MAX_SCAN_INTERVAL
 from .dlms_cosem import async_extract_error_codes
 from .entity import CosemEntity, CosemEntityDescription
 
-SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+if TYPE_CHECKING:
+    from . import DlmsCosemConfigEntry
 
 PARALLEL_UPDATES = 0
 
+SELF_TEST_MAX_UPDATE_INTERVAL: Final = timedelta(seconds=MAX_SCAN_INTERVAL)
+
 
 @dataclass(frozen=True, kw_only=True)
 class CosemBinarySensorEntityDescription(
@@ -39,9 +42,10 @@ BINARY_SENSOR_TYPES: tuple[CosemBinarySensorEntityDescription, ...] = (
         key="self_test",
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
+        max_update_interval=SELF_TEST_MAX_UPDATE_INTERVAL,
         obis=cosem.Obis(0, 0, 97, 97, 0),
         translation_key="self_test",
-        value_fn=lambda x: any(byte for byte in x),
+        value_fn=any,
     ),
 )
 
@@ -49,16 +53,20 @@ BINARY_SENSOR_TYPES: tuple[CosemBinarySensorEntityDescription, ...] = (
 class CosemBinarySensor(CosemEntity, BinarySensorEntity):
     """Represents the COSEM binary sensor platform."""
 
+    _last_response: bytes | None = None
     entity_description: CosemBinarySensorEntityDescription
 
-    async def async_update(self) -> None:
-        """Update entity state."""
-        if response := await self.connection.async_get(self.cosem_attribute):
-            self._attr_is_on = self.entity_description.value_fn(response)
-            if self.entity_description.key == "self_test":
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the entity attributes from the coordinator data."""
+        description = self.entity_description
+        if (response := self.response) and response != self._last_response:
+            self._last_response = response
+            self._attr_is_on = is_on = description.value_fn(response)
+            if description.key == "self_test":
                 self._attr_extra_state_attributes = (
                     {"error_codes": ", ".join(async_extract_error_codes(response))}
-                    if self.is_on
+                    if is_on
                     else {}
                 )
 
@@ -71,7 +79,9 @@ async def async_setup_entry(
     """Set up the binary sensor platform."""
     data = entry.runtime_data
     async_add_entities(
-        CosemBinarySensor(data.connection, description)
-        for description in BINARY_SENSOR_TYPES
+        [
+            CosemBinarySensor(data.coordinator, description)
+            for description in BINARY_SENSOR_TYPES
+        ]
     )
     return True
@@ -5,9 +5,10 @@ from __future__ import annotations
 import asyncio
 from collections.abc import MutableMapping
 import logging
-from operator import itemgetter
 from typing import Any, Final, cast
 
+from dlms_cosem import enumerations
+from dlms_cosem.client import DataResultError
 from dlms_cosem.exceptions import CommunicationError, LocalDlmsProtocolError
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import ATTR_MANUFACTURER, ATTR_MODEL, ATTR_SW_VERSION
@@ -40,7 +41,6 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
-DEVICE_INFO_GETTER = itemgetter(ATTR_MANUFACTURER, ATTR_MODEL, ATTR_EQUIPMENT_ID)
 IDENTIFY_TIMEOUT: Final = 10
 
 _LOGGER = logging.getLogger(__name__)
@@ -103,7 +103,7 @@ class DlmsCosemConfigFlow(ConfigFlow, domain=DOMAIN):
         """Identify the device."""
         if not self.identify_task:
             self.identify_task = self.hass.async_create_task(
-                self._async_identify_device(), eager_start=False
+                self._async_identify_device(), eager_start=True
             )
 
         if not self.identify_task.done():
@@ -114,8 +114,8 @@ class DlmsCosemConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
         try:
-            await asyncio.wait_for(self.identify_task, timeout=IDENTIFY_TIMEOUT)
-        except (TimeoutError, CommunicationError) as err:
+            await self.identify_task
+        except (TimeoutError, CommunicationError, DataResultError) as err:
             _LOGGER.error(err)
             return self.async_show_progress_done(next_step_id="identify_failed")
         finally:
@@ -129,8 +129,9 @@ class DlmsCosemConfigFlow(ConfigFlow, domain=DOMAIN):
         """Finish the integration config."""
         client = cast(DlmsClient, self.client)
         await client.async_disconnect()
-        manufacturer, model, equipment_id = DEVICE_INFO_GETTER(self.init_info)
-        await self._async_set_unique_id(equipment_id)
+        manufacturer = self.init_info[ATTR_MANUFACTURER]
+        model = self.init_info[ATTR_MODEL]
+        await self._async_set_unique_id(self.init_info[ATTR_EQUIPMENT_ID])
         return self.async_create_entry(
             title=f"{manufacturer} {model}", data=self.init_info
         )
@@ -149,12 +150,19 @@ class DlmsCosemConfigFlow(ConfigFlow, domain=DOMAIN):
     async def _async_identify_device(self) -> None:
         """Identify the device."""
         client = cast(DlmsClient, self.client)
-        logical_device_name: bytes = await client.async_get(COSEM_LOGICAL_DEVICE_NAME)
+        async with asyncio.timeout(IDENTIFY_TIMEOUT):
+            values = await client.async_get_many(
+                (COSEM_LOGICAL_DEVICE_NAME, COSEM_EQUIPMENT_ID, COSEM_SOFTWARE_PACKAGE)
+            )
+
+        for value in values:
+            if isinstance(value, enumerations.DataAccessResult):
+                raise DataResultError(f"Could not identify the device: {value!r}")
+
+        logical_device_name, equipment_id, sw_version = values
         manufacturer, model = await async_decode_logical_device_name(
             logical_device_name.decode(encoding="utf-8")
         )
-        equipment_id = await client.async_get(COSEM_EQUIPMENT_ID)
-        sw_version = await client.async_get(COSEM_SOFTWARE_PACKAGE)
         self.init_info.update(
             {
                 ATTR_EQUIPMENT_ID: equipment_id,
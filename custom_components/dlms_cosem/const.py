@@ -9,7 +9,6 @@ from dlms_cosem import cosem, enumerations
 DOMAIN: Final = "dlms_cosem"
 
 # Attributes
-ATTR_DATA: Final = "data"
 ATTR_EQUIPMENT_ID: Final = "equipment_id"
 
 # Configuration
@@ -24,22 +23,20 @@ DEFAULT_MODEL: Final = "Smart meter"
 DEFAULT_PASSWORD: Final = "111111"
 DEFAULT_PORT: Final = 23
 DEFAULT_SCAN_INTERVAL: Final = 15  # seconds
-
-# Dispatcher signals
-SIGNAL_AVAILABLE: Final = "available"
+MAX_SCAN_INTERVAL: Final = 120  # seconds
 
 # COSEM attributes
-COSEM_EQUIPMENT_ID = cosem.CosemAttribute(
+COSEM_EQUIPMENT_ID: Final = cosem.CosemAttribute(
     interface=enumerations.CosemInterface.DATA,
     instance=cosem.Obis(0, 0, 96, 1, 0),
     attribute=DEFAULT_ATTRIBUTE,
 )
-COSEM_LOGICAL_DEVICE_NAME = cosem.CosemAttribute(
+COSEM_LOGICAL_DEVICE_NAME: Final = cosem.CosemAttribute(
     interface=enumerations.CosemInterface.DATA,
     instance=cosem.Obis(0, 0, 42, 0, 0),
     attribute=DEFAULT_ATTRIBUTE,
 )
-COSEM_SOFTWARE_PACKAGE = cosem.CosemAttribute(
+COSEM_SOFTWARE_PACKAGE: Final = cosem.CosemAttribute(
     interface=enumerations.CosemInterface.DATA,
     instance=cosem.Obis(0, 0, 96, 1, 2),
     attribute=DEFAULT_ATTRIBUTE,
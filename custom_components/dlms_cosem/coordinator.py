@@ -0,0 +1,150 @@
+"""Contains the DLMS/COSEM data update coordinator."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import timedelta
+import logging
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Final
+
+from dlms_cosem import enumerations
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .dlms_cosem import DlmsConnection
+
+if TYPE_CHECKING:
+    from .entity import CosemEntityDescription
+
+SCAN_INTERVAL: Final = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+STABLE_READS: Final = 3
+
+UNSUPPORTED_RESULTS: Final = (
+    enumerations.DataAccessResult.OBJECT_UNDEFINED,
+    enumerations.DataAccessResult.OBJECT_UNAVAILABLE,
+    enumerations.DataAccessResult.OBJECT_CLASS_INCONSISTENT,
+    enumerations.DataAccessResult.READ_WRITE_DENIED,
+    enumerations.DataAccessResult.SCOPE_OF_ACCESS_VIOLATED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DlmsCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Represents DLMS/COSEM data update coordinator."""
+
+    connection: DlmsConnection
+    descriptions: tuple[CosemEntityDescription, ...]
+    unsupported: set[str]
+    _intervals: dict[str, float]
+    _last_read: dict[str, float]
+    _stable_reads: dict[str, int]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: DlmsConnection,
+        descriptions: Iterable[CosemEntityDescription],
+    ) -> None:
+        """Initialize a new DLMS/COSEM coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=SCAN_INTERVAL,
+        )
+        self.connection = connection
+        self.descriptions = tuple(descriptions)
+        self.unsupported = set()
+        self._intervals = {}
+        self._last_read = {}
+        self._stable_reads = {}
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Read all requested COSEM attributes in a single batch."""
+        now = monotonic()
+        previous = self.data or {}
+        data: dict[str, Any] = {}
+        descriptions: list[CosemEntityDescription] = []
+        # Entities only register their contexts after the first refresh.
+        contexts: Iterable[CosemEntityDescription] = (
+            self.async_contexts() if self.data is not None else self.descriptions
+        )
+        for description in contexts:
+            if (key := description.key) in self.unsupported:
+                continue
+
+            # Descriptions with their own or a backed off interval reuse the
+            # previous value until that interval has passed.
+            if (
+                (interval := self._async_get_interval(description))
+                and key in previous
+                and now - self._last_read[key] < interval
+            ):
+                data[key] = previous[key]
+            else:
+                descriptions.append(description)
+
+        values = await self.connection.async_get_many(
+            [description.cosem_attribute for description in descriptions]
+        )
+        if descriptions and not values:
+            raise UpdateFailed("Could not read the meter")
+
+        for description, value in zip(descriptions, values, strict=False):
+            key = description.key
+            if not isinstance(value, enumerations.DataAccessResult):
+                if description.max_update_interval:
+                    self._async_back_off(description, value == previous.get(key))
+                data[key] = value
+                self._last_read[key] = now
+            elif value in UNSUPPORTED_RESULTS:
+                self._async_set_unsupported(key, value)
+            else:
+                _LOGGER.debug("Could not read %s, retrying later: %r", key, value)
+
+        return data
+
+    @callback
+    def _async_get_interval(self, description: CosemEntityDescription) -> float:
+        """Return the number of seconds between reads of the attribute."""
+        if (interval := self._intervals.get(description.key)) is not None:
+            return interval
+
+        return (
+            description.update_interval.total_seconds()
+            if description.update_interval
+            else 0
+        )
+
+    @callback
+    def _async_back_off(self, description: CosemEntityDescription, same: bool) -> None:
+        """Read an attribute less often while its value does not change."""
+        key = description.key
+        if not same:
+            self._intervals.pop(key, None)
+            self._stable_reads.pop(key, None)
+            return
+
+        self._stable_reads[key] = stable_reads = self._stable_reads.get(key, 0) + 1
+        if stable_reads >= STABLE_READS and description.max_update_interval:
+            interval = self._async_get_interval(description)
+            self._intervals[key] = min(
+                max(interval, SCAN_INTERVAL.total_seconds()) * 2,
+                description.max_update_interval.total_seconds(),
+            )
+
+    @callback
+    def _async_set_unsupported(
+        self, key: str, reason: enumerations.DataAccessResult
+    ) -> None:
+        """Stop polling an attribute that the meter refused to read."""
+        _LOGGER.warning("Meter does not support %s, skipping: %r", key, reason)
+        self.unsupported.add(key)
+
+    async def async_handle_available(self, available: bool) -> None:
+        """Refresh the data once the connection becomes available."""
+        if available:
+            await self.async_request_refresh()
@@ -3,32 +3,34 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, MutableMapping
+from collections.abc import Callable, MutableMapping, Sequence
 from contextlib import suppress
 import datetime as dt
 from datetime import datetime, timedelta
-from functools import cached_property
+from functools import cached_property, lru_cache
 import logging
 from pathlib import Path
+import random
+import socket
 from typing import Any, Final, cast
 
-import aiofiles
-from dlms_cosem import a_xdr, cosem
-from dlms_cosem.client import DlmsClient as BlockingDlmsClient
+from dlms_cosem import cosem, time, utils
+from dlms_cosem.client import DataResultError, DlmsClient as BlockingDlmsClient
+from dlms_cosem.exceptions import DlmsClientException
 from dlms_cosem.io import BlockingTcpIO, HdlcTransport, IoImplementation
+from dlms_cosem.protocol import xdlms
 from dlms_cosem.security import (
     AuthenticationMethodManager,
     LowLevelSecurityAuthentication,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_MANUFACTURER, ATTR_MODEL, ATTR_SW_VERSION
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.event import async_call_later
-import ijson
+from homeassistant.util.json import json_loads
 
 from .const import (
-    ATTR_DATA,
     ATTR_EQUIPMENT_ID,
     CONF_HOST,
     CONF_PASSWORD,
@@ -36,48 +38,47 @@ from .const import (
     CONF_PORT,
     DEFAULT_MODEL,
     DOMAIN,
-    SIGNAL_AVAILABLE,
 )
 
 LOGICAL_CLIENT_ADDRESS: Final = 32
 LOGICAL_SERVER_ADDRESS: Final = 1
 
 RECONNECT_INTERVAL: Final = timedelta(seconds=3)
+MAX_RECONNECT_INTERVAL: Final = timedelta(minutes=3)
 
 TIMEOUT: Final = 5
 
+FLAG_IDS_PATH: Final = Path(__file__).with_name("dlms_flagids.json")
+
+MAX_ATTRIBUTES_PER_REQUEST: Final = 10
+
 LOGICAL_DEVICE_NAME_FORMATTER: dict[str, Callable[[str], str]] = {
     "INC": lambda x: f"Mercury {x[3:6]}",
 }
 
-A_XDR_DECODER = a_xdr.AXdrDecoder(
-    encoding_conf=a_xdr.EncodingConf(
-        attributes=[a_xdr.Sequence(attribute_name=ATTR_DATA)]
-    )
-)
+_FLAG_IDS: dict[str, str] = {}
+_FLAG_IDS_LOCK = asyncio.Lock()
+_TZ_CACHE: dict[int, dt.timezone] = {}
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_decode_flag_id(flag_id: str) -> str:
+async def async_decode_flag_id(flag_id: str) -> str | None:
     """Decode the flag id."""
-    dlms_flag_ids_file = Path(__file__).with_name("dlms_flagids.json")
+    if not _FLAG_IDS:
+        async with _FLAG_IDS_LOCK:
+            if not _FLAG_IDS:
+                data = await asyncio.to_thread(FLAG_IDS_PATH.read_bytes)
+                _FLAG_IDS.update(cast(dict[str, str], json_loads(data)))
 
-    async with aiofiles.open(dlms_flag_ids_file, mode="rb") as f:
-        async for key, value in ijson.kvitems_async(f, ""):
-            if key == flag_id:
-                return cast(str, value)
-
-    raise KeyError
+    return _FLAG_IDS.get(flag_id)
 
 
 async def async_decode_logical_device_name(logical_device_name: str) -> tuple[str, str]:
     """Decode logical device name."""
     flag_id = logical_device_name[0:3]
 
-    try:
-        manufacturer = await async_decode_flag_id(flag_id)
-    except KeyError:
+    if (manufacturer := await async_decode_flag_id(flag_id)) is None:
         manufacturer = "Unknown"
 
     if formatter := LOGICAL_DEVICE_NAME_FORMATTER.get(flag_id, None):
@@ -93,11 +94,17 @@ def async_extract_error_codes(error_code: bytes, prefix: str = "E-") -> list[str
     """Extract the error code list from bytes."""
     error_length = len(error_code) * 8
     error_number = int.from_bytes(error_code, byteorder="big")
-    return [
-        f"{prefix}{(index + 1):02d}"
-        for index in range(0, error_length - 1)
-        if error_number & (1 << index)
-    ]
+    error_codes: list[str] = []
+    while error_number:
+        lowest_bit = error_number & -error_number
+        if (bit_number := lowest_bit.bit_length()) == error_length:
+            # The most significant bit is not reported.
+            break
+
+        error_codes.append(f"{prefix}{bit_number:02d}")
+        error_number ^= lowest_bit
+
+    return error_codes
 
 
 @callback
@@ -107,14 +114,42 @@ def async_dlms_datetime_to_ha_datetime(dattim: dt.datetime) -> dt.datetime:
     if utcoffset is None:
         return dattim
 
-    local_tz = dt.timezone(offset=dt.timedelta(seconds=-utcoffset.total_seconds()))
+    seconds = int(utcoffset.total_seconds())
+    if (local_tz := _TZ_CACHE.get(seconds)) is None:
+        local_tz = _TZ_CACHE[seconds] = dt.timezone(
+            offset=dt.timedelta(seconds=-seconds)
+        )
+
     return dattim.replace(tzinfo=local_tz)
 
 
+@lru_cache(maxsize=64)
+def _decode_dlms_datetime(value: bytes) -> dt.datetime:
+    """Decode the DLMS date-time and convert it to HA datetime."""
+    return async_dlms_datetime_to_ha_datetime(time.datetime_from_bytes(value)[0])
+
+
+@callback
+def async_decode_dlms_datetime(value: bytes | bytearray) -> dt.datetime:
+    """Decode the DLMS date-time and convert it to HA datetime."""
+    # The cache needs a hashable key.
+    return _decode_dlms_datetime(bytes(value))
+
+
+class NoDelayTcpIO(BlockingTcpIO):  # type: ignore[misc]
+    """Represents blocking TCP IO with Nagle's algorithm disabled."""
+
+    def connect(self) -> None:
+        """Connect the socket and send small frames immediately."""
+        super().connect()
+        self.tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
 class DlmsClient:
     """Represents a DLMS client."""
 
     _host: str
+    _lock: asyncio.Lock
     _password: bytes
     _physical_address: int
     _port: int
@@ -133,7 +168,8 @@ class DlmsClient:
     ) -> None:
         """Initialize a new async DLMS client."""
         self._host = host
-        self._password = bytes(password, encoding="utf-8")
+        self._lock = asyncio.Lock()
+        self._password = password.encode()
         self._physical_address = physical_address
         self._port = port
         self._timeout = timeout
@@ -142,8 +178,22 @@ class DlmsClient:
 
     async def async_connect(self) -> None:
         """Initiate the connection and associate the client."""
-        if not self.client:
-            self.client = BlockingDlmsClient(
+
+        def _connect(client: BlockingDlmsClient) -> None:
+            """Connect and associate the client."""
+            try:
+                client.connect()
+                client.associate()
+            except Exception:
+                with suppress(Exception):
+                    client.transport.io.disconnect()
+                raise
+
+        async with self._lock:
+            if self.client:
+                return
+
+            client = BlockingDlmsClient(
                 transport=HdlcTransport(
                     client_logical_address=LOGICAL_CLIENT_ADDRESS,
                     server_logical_address=LOGICAL_SERVER_ADDRESS,
@@ -152,42 +202,139 @@ class DlmsClient:
                 ),
                 authentication=self.authentication,
             )
-            for job in (self.client.connect, self.client.associate):
-                await self.hass.async_add_executor_job(job)
+            await self.hass.async_add_executor_job(_connect, client)
+            # Only expose the client once the association is established.
+            self.client = client
 
-    async def async_get(self, attribute: cosem.CosemAttribute) -> Any:
-        """Get the COSEM attribute and decode it."""
+    async def async_get_many(
+        self, attributes: Sequence[cosem.CosemAttribute], with_list: bool = False
+    ) -> list[Any]:
+        """Get the COSEM attributes and decode them."""
 
         def _get_cosem_attribute(
             client: BlockingDlmsClient, attribute: cosem.CosemAttribute
         ) -> Any:
-            """Get the COSEM attribute."""
-            response = client.get(attribute)
-            return A_XDR_DECODER.decode(response)[ATTR_DATA]
-
-        if self.client:
-            async with self.hass.timeout.async_timeout(TIMEOUT, DOMAIN):
-                return await self.hass.async_add_executor_job(
-                    _get_cosem_attribute, self.client, attribute
+            """Get the COSEM attribute or the reason the meter refused it."""
+            client.send(
+                xdlms.GetRequestNormal(cosem_attribute=attribute, access_selection=None)
+            )
+            data = bytearray()
+            while True:
+                response = client.next_event()
+                if isinstance(
+                    response,
+                    xdlms.GetResponseNormalWithError
+                    | xdlms.GetResponseLastBlockWithError,
+                ):
+                    return response.error
+
+                if isinstance(response, xdlms.GetResponseWithBlock):
+                    data.extend(response.data)
+                    client.send(
+                        xdlms.GetRequestNext(
+                            invoke_id_and_priority=response.invoke_id_and_priority,
+                            block_number=response.block_number,
+                        )
+                    )
+                    continue
+
+                if not isinstance(
+                    response, xdlms.GetResponseNormal | xdlms.GetResponseLastBlock
+                ):
+                    raise DataResultError(
+                        f"Could not perform GET request: {response!r}"
+                    )
+
+                data.extend(response.data)
+                return utils.parse_as_dlms_data(bytes(data))
+
+        def _get_cosem_attributes(
+            client: BlockingDlmsClient, attributes: Sequence[cosem.CosemAttribute]
+        ) -> list[Any]:
+            """Get the COSEM attributes one by one."""
+            return [_get_cosem_attribute(client, attribute) for attribute in attributes]
+
+        def _get_cosem_attributes_with_list(
+            client: BlockingDlmsClient, attributes: Sequence[cosem.CosemAttribute]
+        ) -> list[Any]:
+            """Get the COSEM attributes with a single request."""
+            response = client.get_many(
+                [
+                    cosem.CosemAttributeWithSelection(
+                        attribute=attribute, access_selection=None
+                    )
+                    for attribute in attributes
+                ]
+            )
+            if not isinstance(response, xdlms.GetResponseWithList):
+                raise DataResultError(
+                    f"Could not perform GET-WITH-LIST request: {response!r}"
                 )
 
+            # Match the types returned by single GETs.
+            return [
+                bytes(value) if isinstance(value, bytearray) else value
+                for value in response.result
+            ]
+
+        results: list[Any] = []
+        if not attributes:
+            return results
+
+        async with self._lock:
+            if not (client := self.client):
+                return results
+
+            if not with_list:
+                async with asyncio.timeout(TIMEOUT * len(attributes)):
+                    return await self.hass.async_add_executor_job(
+                        _get_cosem_attributes, client, attributes
+                    )
+
+            for index in range(0, len(attributes), MAX_ATTRIBUTES_PER_REQUEST):
+                async with asyncio.timeout(TIMEOUT):
+                    results += await self.hass.async_add_executor_job(
+                        _get_cosem_attributes_with_list,
+                        client,
+                        attributes[index : index + MAX_ATTRIBUTES_PER_REQUEST],
+                    )
+
+        return results
+
     async def async_disconnect(self) -> None:
         """Close the connection."""
-        if self.client:
+
+        def _disconnect(client: BlockingDlmsClient) -> None:
+            """Release the association and close the connection."""
             for job in (
-                self.client.release_association,
-                self.client.disconnect,
-                self.client.transport.io.disconnect,
+                client.release_association,
+                client.disconnect,
+                client.transport.io.disconnect,
             ):
                 with suppress(Exception):
-                    await self.hass.async_add_executor_job(job)
-
-            self.client = None
+                    job()
+
+        async with self._lock:
+            if self.client:
+                client, self.client = self.client, None
+                await self.hass.async_add_executor_job(_disconnect, client)
+
+    @property
+    def connected(self) -> bool:
+        """Return if the client is connected."""
+        return self.client is not None
+
+    @property
+    def supports_get_with_list(self) -> bool:
+        """Return if the association allows GET-WITH-LIST requests."""
+        return bool(
+            self.client and self.client.dlms_connection.conformance.multiple_references
+        )
 
     @cached_property
     def io(self) -> IoImplementation:
         """Return the IO implementation."""
-        return BlockingTcpIO(host=self._host, port=self._port, timeout=self._timeout)
+        return NoDelayTcpIO(host=self._host, port=self._port, timeout=self._timeout)
 
     @cached_property
     def authentication(self) -> AuthenticationMethodManager:
@@ -198,14 +345,22 @@ class DlmsClient:
 class DlmsConnection:
     """Represents DLMS connection."""
 
-    _update_semaphore: asyncio.Semaphore
+    _available_jobs: list[HassJob[[bool], Any]]
+    _cancel_reconnect: CALLBACK_TYPE | None
+    _closed: bool
+    _get_with_list: bool
+    _reconnect_attempts: int
     client: DlmsClient
     entry: ConfigEntry
     hass: HomeAssistant
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize a new DLMS/COSEM connection."""
-        self._update_semaphore = asyncio.Semaphore(1)
+        self._available_jobs = []
+        self._cancel_reconnect = None
+        self._closed = False
+        self._get_with_list = True
+        self._reconnect_attempts = 0
         self.client = DlmsClient(
             hass,
             host=entry.data[CONF_HOST],
@@ -220,36 +375,91 @@ class DlmsConnection:
         """Initialize the connection."""
         await self.client.async_connect()
 
-    async def async_close(self) -> None:
-        """Close the connection."""
+    async def async_close(self, event: Event | None = None) -> None:
+        """Close the connection and cancel a pending reconnect attempt."""
+        self._closed = True
+        if self._cancel_reconnect:
+            self._cancel_reconnect()
+            self._cancel_reconnect = None
+
         await self.client.async_disconnect()
 
-    async def async_get(self, attribute: cosem.CosemAttribute) -> Any:
-        """Get the attribute or initiate reconnect on failure."""
-        async with self._update_semaphore:
-            try:
-                return await self.client.async_get(attribute)
-            except Exception as err:
-                async_dispatcher_send(self.hass, SIGNAL_AVAILABLE, False)
-                await self._connection_error(err)
+    @callback
+    def async_add_available_listener(
+        self, target: Callable[[bool], Any]
+    ) -> CALLBACK_TYPE:
+        """Listen for connection availability changes."""
+        job = HassJob(target)
+        self._available_jobs.append(job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the availability listener."""
+            self._available_jobs.remove(job)
+
+        return remove_listener
+
+    @callback
+    def async_set_available(self, available: bool) -> None:
+        """Notify the listeners about connection availability."""
+        for job in list(self._available_jobs):
+            self.hass.async_run_hass_job(job, available)
+
+    async def async_get_many(
+        self, attributes: Sequence[cosem.CosemAttribute]
+    ) -> list[Any]:
+        """Get the attributes or initiate reconnect on failure."""
+        if not self.client.connected:
+            return []
+
+        with_list = self._get_with_list and self.client.supports_get_with_list
+        try:
+            return await self.client.async_get_many(attributes, with_list)
+        except Exception as err:
+            # Some meters advertise GET-WITH-LIST but fail to answer it.
+            if with_list and isinstance(err, DataResultError | DlmsClientException):
+                _LOGGER.debug("Disabling GET-WITH-LIST requests: %s", err)
+                self._get_with_list = False
+
+            self.async_set_available(False)
+            await self._connection_error(err)
+
+        return []
 
     async def _connection_error(self, err: Exception) -> None:
         """Log error and schedule a reconnect attempt."""
-        await self.async_close()
+        await self.client.async_disconnect()
+        if self._closed:
+            return
+
         _LOGGER.warning(
             "Connection lost, retrying in the background: %s",
             "connection timed out" if isinstance(err, TimeoutError) else err,
         )
-        async_call_later(self.hass, RECONNECT_INTERVAL, self._reconnect)
+        delay = min(
+            RECONNECT_INTERVAL * 2 ** min(self._reconnect_attempts, 6),
+            MAX_RECONNECT_INTERVAL,
+        )
+        self._reconnect_attempts += 1
+        self._cancel_reconnect = async_call_later(
+            self.hass, delay.total_seconds() + random.random(), self._reconnect
+        )
 
     async def _reconnect(self, event_time: datetime) -> None:
         """Try to reconnect on connection failure."""
+        self._cancel_reconnect = None
         try:
             await self.async_connect()
         except Exception as err:
             await self._connection_error(err)
         else:
-            async_dispatcher_send(self.hass, SIGNAL_AVAILABLE, True)
+            if self._closed:
+                # The entry was unloaded while the attempt was in progress.
+                await self.client.async_disconnect()
+                return
+
+            self._reconnect_attempts = 0
+            self.async_set_available(True)
 
     @cached_property
     def manufacturer(self) -> str:
@@ -271,6 +481,18 @@ class DlmsConnection:
         """Return the serial number."""
         return cast(str, self.entry.data[ATTR_EQUIPMENT_ID])
 
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of the meter."""
+        return DeviceInfo(
+            name=f"{self.manufacturer} {self.model}",
+            identifiers={(DOMAIN, self.equipment_id)},
+            manufacturer=self.manufacturer,
+            model=self.model,
+            serial_number=self.equipment_id,
+            sw_version=self.sw_version,
+        )
+
     @staticmethod
     async def async_check(
         hass: HomeAssistant, data: MutableMapping[str, Any]
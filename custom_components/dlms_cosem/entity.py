@@ -2,15 +2,17 @@
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import timedelta
 from functools import cached_property
 from typing import Any
 
 from dlms_cosem import cosem, enumerations
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DEFAULT_ATTRIBUTE, DOMAIN, SIGNAL_AVAILABLE
+from .const import DEFAULT_ATTRIBUTE
+from .coordinator import DlmsCoordinator
 from .dlms_cosem import DlmsConnection
 
 
@@ -20,58 +22,76 @@ class CosemEntityDescription(EntityDescription):
 
     attribute: int = DEFAULT_ATTRIBUTE
     interface: enumerations.CosemInterface
+    max_update_interval: timedelta | None = None
     obis: cosem.Obis
+    update_interval: timedelta | None = None
     value_fn: Callable[[Any], Any]
 
+    @cached_property
+    def cosem_attribute(self) -> cosem.CosemAttribute:
+        """Return the COSEM attribute shared by all entities of this type."""
+        return cosem.CosemAttribute(
+            interface=self.interface,
+            instance=self.obis,
+            attribute=self.attribute,
+        )
+
 
-class CosemEntity(Entity):
+class CosemEntity(CoordinatorEntity[DlmsCoordinator]):
     """Represents the COSEM entity."""
 
     _attr_has_entity_name = True
     connection: DlmsConnection
     entity_description: CosemEntityDescription
 
-    def __init__(self, connection: DlmsConnection, description: CosemEntityDescription):
+    def __init__(
+        self, coordinator: DlmsCoordinator, description: CosemEntityDescription
+    ):
         """Initialize the COSEM object."""
+        super().__init__(coordinator, description)
+        connection = coordinator.connection
         self.connection = connection
         self.entity_description = description
+        self._attr_unique_id = f"{connection.entry.unique_id}-{description.key}"
+        self._attr_device_info = connection.device_info
+        self._async_update_attrs()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass, SIGNAL_AVAILABLE, self._available_callback
-            )
+            self.connection.async_add_available_listener(self._available_callback)
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the entity attributes from the coordinator data."""
+
     @callback
     def _available_callback(self, available: bool) -> None:
         """Mark entity as un/available and update ha state."""
-        self._attr_available = available
-        self.async_schedule_update_ha_state(force_refresh=True if available else False)
+        if available == self._attr_available:
+            return
 
-    @cached_property
-    def unique_id(self) -> str:
-        """Return the unique ID."""
-        return f"{self.connection.entry.unique_id}-{self.entity_description.key}"
+        self._attr_available = available
+        self.async_write_ha_state()
 
-    @cached_property
-    def cosem_attribute(self) -> cosem.CosemAttribute:
-        """Return the COSEM attribute."""
-        return cosem.CosemAttribute(
-            interface=self.entity_description.interface,
-            instance=self.entity_description.obis,
-            attribute=self.entity_description.attribute,
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return (
+            self._attr_available
+            and super().available
+            and self.entity_description.key not in self.coordinator.unsupported
         )
 
-    @cached_property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            name=f"{self.connection.manufacturer} {self.connection.model}",
-            identifiers={(DOMAIN, self.connection.equipment_id)},
-            manufacturer=self.connection.manufacturer,
-            model=self.connection.model,
-            serial_number=self.connection.equipment_id,
-            sw_version=self.connection.sw_version,
-        )
+    @property
+    def response(self) -> Any:
+        """Return the last response for the entity's COSEM attribute."""
+        return self.coordinator.data.get(self.entity_description.key)
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Final
 
-from dlms_cosem import cosem, enumerations, time
+from dlms_cosem import cosem, enumerations
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -22,19 +23,35 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import DlmsCosemConfigEntry
-from .const import DEFAULT_SCAN_INTERVAL
-from .dlms_cosem import async_dlms_datetime_to_ha_datetime
+from .dlms_cosem import async_decode_dlms_datetime
 from .entity import CosemEntity, CosemEntityDescription
 
-SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+if TYPE_CHECKING:
+    from . import DlmsCosemConfigEntry
 
 PARALLEL_UPDATES = 0
 
+EVENT_UPDATE_INTERVAL: Final = timedelta(minutes=5)
+
+
+def _hundredths(value: int) -> float:
+    """Scale the value reported in hundredths."""
+    return value / 100
+
+
+def _thousandths(value: int) -> float:
+    """Scale the value reported in thousandths."""
+    return value / 1000
+
+
+def _unchanged(value: Any) -> Any:
+    """Return the value as is."""
+    return value
+
 
 @dataclass(frozen=True, kw_only=True)
 class CosemSensorEntityDescription(CosemEntityDescription, SensorEntityDescription):
@@ -52,7 +69,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         translation_key="current_l1",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="current_l2",
@@ -62,7 +79,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         translation_key="current_l2",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="current_l3",
@@ -72,7 +89,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         translation_key="current_l3",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="voltage_l1",
@@ -82,7 +99,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="voltage_l1",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="voltage_l2",
@@ -92,7 +109,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="voltage_l2",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="voltage_l3",
@@ -102,7 +119,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="voltage_l3",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="active_power_total",
@@ -112,7 +129,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="active_power_total",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="active_power_l1",
@@ -122,7 +139,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="active_power_l1",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="active_power_l2",
@@ -132,7 +149,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="active_power_l2",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="active_power_l3",
@@ -142,7 +159,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="active_power_l3",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="apparent_power_l1",
@@ -152,7 +169,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="apparent_power_l1",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="apparent_power_l2",
@@ -162,7 +179,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="apparent_power_l2",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="apparent_power_l3",
@@ -172,7 +189,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="apparent_power_l3",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="apparent_power_total",
@@ -182,7 +199,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=1,
         translation_key="apparent_power_total",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="power_factor_total",
@@ -191,7 +208,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         translation_key="power_factor_total",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="power_factor_l1",
@@ -200,7 +217,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         translation_key="power_factor_l1",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="power_factor_l2",
@@ -209,7 +226,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         translation_key="power_factor_l2",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="power_factor_l3",
@@ -218,7 +235,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=3,
         translation_key="power_factor_l3",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="active_energy_total",
@@ -228,7 +245,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=2,
         translation_key="active_energy_total",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="active_energy_tariff1",
@@ -238,7 +255,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=2,
         translation_key="active_energy_tariff1",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="active_energy_tariff2",
@@ -248,7 +265,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=2,
         translation_key="active_energy_tariff2",
-        value_fn=lambda x: x / 1000,
+        value_fn=_thousandths,
     ),
     CosemSensorEntityDescription(
         key="frequency",
@@ -258,14 +275,14 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=2,
         translation_key="frequency",
-        value_fn=lambda x: x / 100,
+        value_fn=_hundredths,
     ),
     CosemSensorEntityDescription(
         key="active_tariff",
         interface=enumerations.CosemInterface.DATA,
         obis=cosem.Obis(0, 0, 96, 14, 0),
         translation_key="active_tariff",
-        value_fn=lambda x: x,
+        value_fn=_unchanged,
     ),
     CosemSensorEntityDescription(
         key="internal_temperature",
@@ -276,7 +293,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
         translation_key="internal_temperature",
-        value_fn=lambda x: x,
+        value_fn=_unchanged,
     ),
     CosemSensorEntityDescription(
         key="uptime",
@@ -288,7 +305,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
         translation_key="uptime",
-        value_fn=lambda x: x,
+        value_fn=_unchanged,
     ),
     CosemSensorEntityDescription(
         key="local_time",
@@ -298,9 +315,7 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         interface=enumerations.CosemInterface.CLOCK,
         obis=cosem.Obis(0, 0, 1, 0, 0),
         translation_key="local_time",
-        value_fn=lambda x: async_dlms_datetime_to_ha_datetime(
-            time.datetime_from_bytes(x)[0]
-        ),
+        value_fn=async_decode_dlms_datetime,
     ),
     CosemSensorEntityDescription(
         key="clock_synced",
@@ -310,9 +325,8 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         interface=enumerations.CosemInterface.DATA,
         obis=cosem.Obis(0, 0, 96, 2, 12),
         translation_key="clock_synced",
-        value_fn=lambda x: async_dlms_datetime_to_ha_datetime(
-            time.datetime_from_bytes(x)[0]
-        ),
+        update_interval=EVENT_UPDATE_INTERVAL,
+        value_fn=async_decode_dlms_datetime,
     ),
     CosemSensorEntityDescription(
         key="front_cover_opened",
@@ -322,9 +336,8 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         interface=enumerations.CosemInterface.DATA,
         obis=cosem.Obis(0, 0, 96, 20, 1),
         translation_key="front_cover_opened",
-        value_fn=lambda x: async_dlms_datetime_to_ha_datetime(
-            time.datetime_from_bytes(x)[0]
-        ),
+        update_interval=EVENT_UPDATE_INTERVAL,
+        value_fn=async_decode_dlms_datetime,
     ),
     CosemSensorEntityDescription(
         key="terminals_cover_opened",
@@ -334,9 +347,8 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         interface=enumerations.CosemInterface.DATA,
         obis=cosem.Obis(0, 0, 96, 20, 6),
         translation_key="terminals_cover_opened",
-        value_fn=lambda x: async_dlms_datetime_to_ha_datetime(
-            time.datetime_from_bytes(x)[0]
-        ),
+        update_interval=EVENT_UPDATE_INTERVAL,
+        value_fn=async_decode_dlms_datetime,
     ),
     CosemSensorEntityDescription(
         key="magnetic_field_detected",
@@ -346,9 +358,8 @@ SENSOR_TYPES: tuple[CosemSensorEntityDescription, ...] = (
         interface=enumerations.CosemInterface.DATA,
         obis=cosem.Obis(0, 0, 96, 20, 16),
         translation_key="magnetic_field_detected",
-        value_fn=lambda x: async_dlms_datetime_to_ha_datetime(
-            time.datetime_from_bytes(x)[0]
-        ),
+        update_interval=EVENT_UPDATE_INTERVAL,
+        value_fn=async_decode_dlms_datetime,
     ),
 )
 
@@ -358,9 +369,10 @@ class CosemSensor(CosemEntity, SensorEntity):
 
     entity_description: CosemSensorEntityDescription
 
-    async def async_update(self) -> None:
-        """Update entity state."""
-        if response := await self.connection.async_get(self.cosem_attribute):
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the entity attributes from the coordinator data."""
+        if response := self.response:
             self._attr_native_value = self.entity_description.value_fn(response)
 
 
@@ -372,6 +384,6 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     data = entry.runtime_data
     async_add_entities(
-        CosemSensor(data.connection, description) for description in SENSOR_TYPES
+        [CosemSensor(data.coordinator, description) for description in SENSOR_TYPES]
     )
     return True
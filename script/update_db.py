@@ -7,11 +7,10 @@ from io import BytesIO
 import json
 from pathlib import Path
 import sys
-from typing import Final
-from urllib.request import urlretrieve
+from typing import Any, Final
+from urllib.request import urlopen
 
 import openpyxl
-from openpyxl.worksheet.worksheet import Worksheet
 
 URL: Final = "https://www.dlms.com/srv/lib/Export_Flagids.php"
 FILENAME: Final = "dlms_flagids.json"
@@ -23,23 +22,23 @@ OVERRIDES: dict[str, str] = {
 }
 
 
-def worksheet_items(ws: Worksheet) -> Generator[tuple[str, str]]:
+def worksheet_items(ws: Any) -> Generator[tuple[str, str]]:
     """Return flag id and manufacturer tuple from the worksheet."""
-    row = 2
-    while row < ws.max_row:
-        yield (
-            ws.cell(row, COL["flag_id"]).value,
-            ws.cell(row, COL["manufacturer"]).value,
-        )
-        row += 1
+    for flag_id, manufacturer in ws.iter_rows(
+        min_row=2,
+        min_col=COL["flag_id"],
+        max_col=COL["manufacturer"],
+        values_only=True,
+    ):
+        if flag_id:
+            yield flag_id, manufacturer
 
 
 sys.stdout.write("Updating flag ids...\n")
-xlsx_filename, _ = urlretrieve(URL)
-with open(xlsx_filename, "rb") as f:
-    buffer = BytesIO(f.read())
+with urlopen(URL) as response:
+    buffer = BytesIO(response.read())
 
-wb = openpyxl.load_workbook(buffer)
+wb = openpyxl.load_workbook(buffer, read_only=True, data_only=True)
 manufacturers = dict(worksheet_items(wb.active))
 wb.close()
 